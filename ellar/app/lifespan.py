@@ -1,6 +1,7 @@
 import typing as t
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
 from ellar.common import IApplicationShutdown, IApplicationStartup
 from ellar.common.logging import logger
 
@@ -38,6 +39,12 @@ class EllarApplicationLifespan:
             if issubclass(module, IApplicationShutdown):
                 yield app.injector.get(module)
 
+    def _configure_threadpool(self, app: "App") -> None:
+        threadpool_tokens = app.config.THREADPOOL_TOKENS
+        if threadpool_tokens:
+            limiter = anyio.to_thread.current_default_thread_limiter()
+            limiter.total_tokens = threadpool_tokens
+
     async def run_all_startup_actions(self, app: "App") -> None:
         try:
             for module in self._get_startup_modules(app):
@@ -57,6 +64,8 @@ class EllarApplicationLifespan:
     @asynccontextmanager
     async def lifespan(self, app: "App") -> t.AsyncIterator[t.Any]:
         try:
+            self._configure_threadpool(app)
+
             logger.debug("Executing Modules Startup Handlers")
             await self.run_all_startup_actions(app)
 
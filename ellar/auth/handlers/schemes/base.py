@@ -116,6 +116,20 @@ class BaseHttpAuth(BaseAuth, ABC):
     scheme: t.Optional[str] = None
     realm: t.Optional[str] = None
 
+    _scheme_variants: t.FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.scheme:
+            # common casings of the scheme, e.g. `bearer`, `Bearer` and `BEARER`
+            cls._scheme_variants = frozenset(
+                {cls.scheme, cls.scheme.title(), cls.scheme.upper()}
+            )
+
+    @classmethod
+    def _is_valid_scheme(cls, scheme: str) -> bool:
+        return scheme in cls._scheme_variants or scheme.lower() == cls.scheme
+
     @classmethod
     def _authorization_partitioning(
         cls, authorization: t.Optional[str]
@@ -39,7 +39,7 @@ class HttpBearerAuth(BaseHttpAuth, ABC):
         scheme, _, credentials = self._authorization_partitioning(authorization)
         if not (authorization and scheme and credentials):
             return self.handle_invalid_request()  # type: ignore[no-any-return]
-        if scheme and str(scheme).lower() != self.scheme:
+        if not self._is_valid_scheme(scheme):
             raise self.exception_class(
                 status_code=self.status_code,
                 detail="Invalid authentication credentials",
@@ -53,7 +53,7 @@ class HttpBasicAuth(BaseHttpAuth, ABC):
     realm: t.Optional[str] = None
     header = "Authorization"
 
-    def _not_unauthorized_exception(self, message: str) -> None:
+    def _not_unauthorized_exception(self, message: str) -> t.NoReturn:
         if self.realm:  # pragma: no cover
             unauthorized_headers = {"WWW-Authenticate": f'Basic realm="{self.realm}"'}
         else:
@@ -66,35 +66,28 @@ class HttpBasicAuth(BaseHttpAuth, ABC):
 
     def _get_credentials(self, connection: "HTTPConnection") -> HTTPBasicCredentials:
         authorization: t.Optional[str] = connection.headers.get(self.header)
-        parts = authorization.split(" ") if authorization else []
-        scheme, credentials = str(), str()
-
-        if len(parts) == 1:
-            credentials = parts[0]
-            scheme = "basic"
-        elif len(parts) == 2:
-            credentials = parts[1]
-            scheme = parts[0].lower()
-
-        if (
-            not (authorization and scheme and credentials)
-            or scheme.lower() != self.scheme
+        scheme, separator, credentials = self._authorization_partitioning(authorization)
+
+        if not separator:
+            # credentials sent without a scheme
+            scheme, credentials = "basic", scheme
+        elif credentials and " " in credentials:
+            credentials = None
+
+        if not (
+            authorization and scheme and credentials and self._is_valid_scheme(scheme)
         ):
             return self.handle_invalid_request()  # type: ignore[no-any-return]
 
-        data: t.Optional[t.Union[str, bytes]] = None
         try:
-            data = b64decode(credentials).decode("ascii")
+            data = b64decode(credentials, validate=True).decode("ascii")
         except (ValueError, UnicodeDecodeError, binascii.Error):
             self._not_unauthorized_exception("Invalid authentication credentials")
 
-        username, separator, password = (
-            str(data).partition(":") if data else (None, None, None)
-        )
-
+        username, separator, password = data.partition(":")
         if not separator:
             self._not_unauthorized_exception("Invalid authentication credentials")
-        return HTTPBasicCredentials(username=username, password=password)  # type: ignore[arg-type]
+        return HTTPBasicCredentials(username=username, password=password)
 
 
 class HttpDigestAuth(HttpBearerAuth, ABC):
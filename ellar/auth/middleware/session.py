@@ -1,58 +1,186 @@
-from ellar.auth.session import SessionServiceNullStrategy, SessionStrategy
+import re
+import typing as t
+from copy import deepcopy
+
+from ellar.auth.session import (
+    SessionCookieObject,
+    SessionServiceNullStrategy,
+    SessionStrategy,
+)
 from ellar.core.conf import Config
 from ellar.core.middleware import Middleware as EllarMiddleware
 from starlette.datastructures import MutableHeaders
-from starlette.requests import HTTPConnection
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+_unquote_sub = re.compile(r"\\(?:([0-3][0-7][0-7])|(.))").sub
+
+
+def _unquote_replace(match: t.Match[str]) -> str:
+    if match[1]:
+        return chr(int(match[1], 8))
+    return match[2]
+
+
+def _unquote(value: str) -> str:
+    """
+    Linear time version of `http.cookies._unquote`.
+    The stdlib version is quadratic on python releases before 3.12.6
+    """
+    if len(value) < 2 or value[0] != '"' or value[-1] != '"':
+        return value
+    return _unquote_sub(_unquote_replace, value[1:-1])
+
+
+def _get_cookie(scope: Scope, name: str) -> t.Optional[str]:
+    """
+    Reads a single cookie from the request `Cookie` header.
+    Follows starlette's `cookie_parser` but without building a dict of every cookie.
+    """
+    for header_key, header_value in scope["headers"]:
+        if header_key == b"cookie":
+            cookie_string = header_value.decode("latin-1")
+            break
+    else:
+        return None
+
+    value = None
+    position, length = 0, len(cookie_string)
+    while position < length:
+        terminator = cookie_string.find(";", position)
+        if terminator == -1:
+            terminator = length
+
+        equal_sign = cookie_string.find("=", position, terminator)
+        if equal_sign != -1 and cookie_string[position:equal_sign].strip() == name:
+            # the last occurrence wins, as with starlette's parser
+            value = cookie_string[equal_sign + 1 : terminator]
+        position = terminator + 1
+
+    if value is None:
+        return None
+    return _unquote(value.strip())
+
+
+_SESSION_SCOPE_TYPES = frozenset(("http", "websocket"))
+
+
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+
+
+def _snapshot_nested_values(session: t.Any) -> t.Optional[t.Dict[str, t.Any]]:
+    """
+    Copies the mutable values of a loaded session.
+    In-place changes to them, e.g. `session["cart"].append(...)`,
+    do not set the `modified` flag of `SessionCookieObject`.
+    """
+    if not isinstance(session, SessionCookieObject):
+        return None
+    nested_values = {
+        key: value
+        for key, value in dict.items(session)
+        if not isinstance(value, _IMMUTABLE_TYPES)
+    }
+    return deepcopy(nested_values) if nested_values else None
+
+
+def _is_modified(session: t.Any, nested_values: t.Optional[t.Dict[str, t.Any]]) -> bool:
+    if isinstance(session, SessionCookieObject):
+        # read the slot directly, session data may contain a `modified` key
+        if object.__getattribute__(session, "modified"):
+            return True
+        return nested_values is not None and any(
+            dict.get(session, key) != value for key, value in nested_values.items()
+        )
+    return True
+
 
 class SessionMiddleware:
+    __slots__ = (
+        "app",
+        "_session_strategy",
+        "_is_enabled",
+        "_cookie_name",
+        "_refresh_session_cookie",
+        "_serialize_session",
+        "_deserialize_session",
+    )
+
     def __init__(
         self, app: ASGIApp, session_strategy: SessionStrategy, config: Config
     ) -> None:
         config.set_defaults(SESSION_DISABLED=False)
         self.app = app
         self._session_strategy = session_strategy
-        self._is_active = not isinstance(session_strategy, SessionServiceNullStrategy)
-        self._is_disabled = config.SESSION_DISABLED
+        # both settings are fixed for the lifetime of the middleware
+        self._is_enabled = not config.SESSION_DISABLED and not isinstance(
+            session_strategy, SessionServiceNullStrategy
+        )
+
+        cookie_options = session_strategy.session_cookie_options
+        self._cookie_name = cookie_options.NAME
+        # with Max-Age, re-sending the cookie on each response slides its expiry
+        self._refresh_session_cookie = bool(cookie_options.MAX_AGE)
+        self._serialize_session = session_strategy.serialize_session
+        self._deserialize_session = session_strategy.deserialize_session
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        if (
-            scope["type"] not in ("http", "websocket")
-            or not self._is_active
-            or self._is_disabled
-        ):  # pragma: no cover
+        if not self._is_enabled or scope["type"] not in _SESSION_SCOPE_TYPES:
             await self.app(scope, receive, send)
             return
 
-        connection = HTTPConnection(scope)
-        session_service_config = self._session_strategy.session_cookie_options
-
-        if session_service_config.NAME in connection.cookies:
-            data = connection.cookies[session_service_config.NAME]
-            scope["session"] = self._session_strategy.deserialize_session(data)
-        else:
-            scope["session"] = self._session_strategy.deserialize_session(None)
-
-        async def _send_wrapper(message: Message) -> None:
-            if message["type"] == "http.response.start":
-                if scope["session"]:
-                    # We have session data to persist.
-                    headers = MutableHeaders(scope=message)
-                    headers.append(
-                        "Set-Cookie",
-                        self._session_strategy.serialize_session(scope["session"]),
-                    )
-                else:
-                    # The session has been cleared.
-                    headers = MutableHeaders(scope=message)
-                    headers.append(
-                        "Set-Cookie", self._session_strategy.serialize_session("null")
-                    )
+        session_cookie = _get_cookie(scope, self._cookie_name)
+        scope["session"] = session = self._deserialize_session(session_cookie)
+        nested_values = (
+            None
+            if self._refresh_session_cookie or not session
+            else _snapshot_nested_values(session)
+        )
+
+        await self.app(
+            scope,
+            receive,
+            _SessionSendWrapper(self, scope, send, session_cookie, nested_values),
+        )
 
-            await send(message)
 
-        await self.app(scope, receive, _send_wrapper)
+class _SessionSendWrapper:
+    """Writes the session cookie on `http.response.start` before forwarding."""
+
+    __slots__ = ("middleware", "scope", "send", "session_cookie", "nested_values")
+
+    def __init__(
+        self,
+        middleware: SessionMiddleware,
+        scope: Scope,
+        send: Send,
+        session_cookie: t.Optional[str],
+        nested_values: t.Optional[t.Dict[str, t.Any]],
+    ) -> None:
+        self.middleware = middleware
+        self.scope = scope
+        self.send = send
+        self.session_cookie = session_cookie
+        self.nested_values = nested_values
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            middleware = self.middleware
+            session = self.scope["session"]
+            if session:
+                # We have session data to persist.
+                if middleware._refresh_session_cookie or _is_modified(
+                    session, self.nested_values
+                ):
+                    MutableHeaders(scope=message).append(
+                        "Set-Cookie", middleware._serialize_session(session)
+                    )
+            elif self.session_cookie is not None:
+                # The session has been cleared.
+                MutableHeaders(scope=message).append(
+                    "Set-Cookie", middleware._serialize_session("null")
+                )
+
+        await self.send(message)
 
 
 # SessionMiddleware Configuration
@@ -90,15 +90,18 @@ class CacheService(_CacheServiceSync, ICacheService):
         self._backends = backends or {
             "default": LocalMemCacheBackend(key_prefix="ellar", version=1, ttl=300)
         }
+        self._default_backend = self._backends["default"]
 
     def get_backend(self, backend: t.Optional[str] = None) -> BaseCacheBackend:
-        _backend = backend or "default"
-        try:
-            return self._backends[_backend]
-        except KeyError as kex:
+        if not backend:
+            return self._default_backend
+
+        _backend = self._backends.get(backend)
+        if _backend is None:
             raise InvalidCacheBackendKeyException(
-                f"There is no backend configured with the name: '{_backend}'"
-            ) from kex
+                f"There is no backend configured with the name: '{backend}'"
+            )
+        return _backend
 
     async def get_async(
         self, key: str, version: t.Optional[str] = None, backend: t.Optional[str] = None
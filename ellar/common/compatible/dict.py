@@ -2,11 +2,18 @@ import typing as t
 
 from ellar.common.types import KT, VT
 
+_NOT_FOUND = object()
+_dict_get = dict.get
+
 
 class AttributeDictAccessMixin:
+    """Expects to be mixed into a `dict` subclass."""
+
     def __getattribute__(self, name: t.Any) -> t.Optional[t.Any]:
-        if name in self:
-            return self.__attribute_dict__(self[name])
+        # single lookup that bypasses `__missing__`
+        value = _dict_get(self, name, _NOT_FOUND)
+        if value is not _NOT_FOUND:
+            return self.__attribute_dict__(value)
         try:
             return super(AttributeDictAccessMixin, self).__getattribute__(name)
         except Exception:
@@ -23,11 +30,12 @@ class AttributeDictAccessMixin:
 
 class AttributeDict(AttributeDictAccessMixin, t.Dict[KT, VT]):
     def __setattr__(self, name: KT, value: VT) -> None:  # type: ignore
-        self.update({name: value})
+        self[name] = value
 
     def set_defaults(self, **kwargs: t.Any) -> None:
+        setdefault = self.setdefault
         for k, v in kwargs.items():
-            self.setdefault(k, v)  # type: ignore
+            setdefault(k, v)  # type: ignore
 
     def __missing__(self, name) -> VT:
         return None
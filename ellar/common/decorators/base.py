@@ -1,5 +1,4 @@
 import typing as t
-from functools import partial
 
 from ellar.common.constants import NOT_SET
 from ellar.reflect import reflect
@@ -10,7 +9,11 @@ def set_metadata(
     meta_value: t.Optional[t.Any] = NOT_SET,
 ) -> t.Callable:
     if meta_value is NOT_SET:
-        return partial(set_metadata, meta_key)
+
+        def _set_meta_value(value: t.Any) -> t.Callable:
+            return set_metadata(meta_key, value)
+
+        return _set_meta_value
 
     def _decorator(target: t.Union[t.Callable, t.Any]) -> t.Callable:
         reflect.define_metadata(meta_key, meta_value, target)
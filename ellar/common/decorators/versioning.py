@@ -1,10 +1,16 @@
 import typing as t
+from functools import lru_cache
 
 from ellar.common.constants import VERSIONING_KEY
 
 from .base import set_metadata as set_meta
 
 
+@lru_cache(1200)
+def _get_version_decorator(versions: t.Tuple[str, ...]) -> t.Callable:
+    return set_meta(VERSIONING_KEY, set(versions))
+
+
 def Version(*_version: str) -> t.Callable:
     """
      ========= CONTROLLER AND ROUTE FUNCTION DECORATOR ==============
@@ -13,4 +19,4 @@ def Version(*_version: str) -> t.Callable:
     :param _version: allowed versions
     :return:
     """
-    return set_meta(VERSIONING_KEY, {str(i) for i in _version})
+    return _get_version_decorator(tuple(str(i) for i in _version))
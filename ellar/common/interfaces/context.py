@@ -78,6 +78,12 @@ class IExecutionContext(IHostContext, ABC):
     def get_handler(self) -> t.Callable:
         """Gets operation handler"""
 
+    def get_json_response_class(self) -> t.Optional[t.Type[Response]]:
+        """Gets application `DEFAULT_JSON_CLASS`"""
+        return t.cast(
+            t.Optional[t.Type[Response]], self.get_app().config.DEFAULT_JSON_CLASS
+        )
+
     @abstractmethod
     def get_class(self) -> t.Optional[t.Type["ControllerBase"]]:
         """Gets operation handler controller class"""
@@ -126,6 +126,24 @@ class OperationDefinitions:
 
         return _decorator
 
+    def _http_method_operation(
+        self,
+        method: str,
+        path: t.Union[str, t.Callable],
+        *,
+        name: t.Optional[str],
+        include_in_schema: bool,
+        response: t.Any,
+    ) -> t.Callable:
+        endpoint_parameter_partial = functools.partial(
+            RouteParameters,
+            name=name,
+            methods=[method],
+            include_in_schema=include_in_schema,
+            response=response,
+        )
+        return self._get_decorator_or_operation(path, endpoint_parameter_partial)
+
     def get(
         self,
         path: str = "/",
@@ -136,15 +154,9 @@ class OperationDefinitions:
             t.Dict[int, t.Type], t.List[t.Tuple[int, t.Type]], t.Type, t.Any
         ] = None,
     ) -> t.Callable:
-        methods = [GET]
-        endpoint_parameter_partial = functools.partial(
-            RouteParameters,
-            name=name,
-            methods=methods,
-            include_in_schema=include_in_schema,
-            response=response,
+        return self._http_method_operation(
+            GET, path, name=name, include_in_schema=include_in_schema, response=response
         )
-        return self._get_decorator_or_operation(path, endpoint_parameter_partial)
 
     def post(
         self,
@@ -156,15 +168,13 @@ class OperationDefinitions:
             t.Dict[int, t.Type], t.List[t.Tuple[int, t.Type]], t.Type, t.Any
         ] = None,
     ) -> t.Callable:
-        methods = [POST]
-        endpoint_parameter_partial = functools.partial(
-            RouteParameters,
+        return self._http_method_operation(
+            POST,
+            path,
             name=name,
-            methods=methods,
             include_in_schema=include_in_schema,
             response=response,
         )
-        return self._get_decorator_or_operation(path, endpoint_parameter_partial)
 
     def put(
         self,
@@ -176,15 +186,9 @@ class OperationDefinitions:
             t.Dict[int, t.Type], t.List[t.Tuple[int, t.Type]], t.Type, t.Any
         ] = None,
     ) -> t.Callable:
-        methods = [PUT]
-        endpoint_parameter_partial = functools.partial(
-            RouteParameters,
-            name=name,
-            methods=methods,
-            include_in_schema=include_in_schema,
-            response=response,
+        return self._http_method_operation(
+            PUT, path, name=name, include_in_schema=include_in_schema, response=response
         )
-        return self._get_decorator_or_operation(path, endpoint_parameter_partial)
 
     def patch(
         self,
@@ -196,15 +200,13 @@ class OperationDefinitions:
             t.Dict[int, t.Type], t.List[t.Tuple[int, t.Type]], t.Type, t.Any
         ] = None,
     ) -> t.Callable:
-        methods = [PATCH]
-        endpoint_parameter_partial = functools.partial(
-            RouteParameters,
+        return self._http_method_operation(
+            PATCH,
+            path,
             name=name,
-            methods=methods,
             include_in_schema=include_in_schema,
             response=response,
         )
-        return self._get_decorator_or_operation(path, endpoint_parameter_partial)
 
     def delete(
         self,
@@ -216,15 +218,13 @@ class OperationDefinitions:
             t.Dict[int, t.Type], t.List[t.Tuple[int, t.Type]], t.Type, t.Any
         ] = None,
     ) -> t.Callable:
-        methods = [DELETE]
-        endpoint_parameter_partial = functools.partial(
-            RouteParameters,
+        return self._http_method_operation(
+            DELETE,
+            path,
             name=name,
-            methods=methods,
             include_in_schema=include_in_schema,
             response=response,
         )
-        return self._get_decorator_or_operation(path, endpoint_parameter_partial)
 
     def head(
         self,
@@ -236,15 +236,13 @@ class OperationDefinitions:
             t.Dict[int, t.Type], t.List[t.Tuple[int, t.Type]], t.Type, t.Any
         ] = None,
     ) -> t.Callable:
-        methods = [HEAD]
-        endpoint_parameter_partial = functools.partial(
-            RouteParameters,
+        return self._http_method_operation(
+            HEAD,
+            path,
             name=name,
-            methods=methods,
             include_in_schema=include_in_schema,
             response=response,
         )
-        return self._get_decorator_or_operation(path, endpoint_parameter_partial)
 
     def options(
         self,
@@ -256,15 +254,13 @@ class OperationDefinitions:
             t.Dict[int, t.Type], t.List[t.Tuple[int, t.Type]], t.Type, t.Any
         ] = None,
     ) -> t.Callable:
-        methods = [OPTIONS]
-        endpoint_parameter_partial = functools.partial(
-            RouteParameters,
+        return self._http_method_operation(
+            OPTIONS,
+            path,
             name=name,
-            methods=methods,
             include_in_schema=include_in_schema,
             response=response,
         )
-        return self._get_decorator_or_operation(path, endpoint_parameter_partial)
 
     def trace(
         self,
@@ -276,15 +272,13 @@ class OperationDefinitions:
             t.Dict[int, t.Type], t.List[t.Tuple[int, t.Type]], t.Type, t.Any
         ] = None,
     ) -> t.Callable:
-        methods = [TRACE]
-        endpoint_parameter_partial = functools.partial(
-            RouteParameters,
+        return self._http_method_operation(
+            TRACE,
+            path,
             name=name,
-            methods=methods,
             include_in_schema=include_in_schema,
             response=response,
         )
-        return self._get_decorator_or_operation(path, endpoint_parameter_partial)
 
     def http_route(
         self,
@@ -2,6 +2,7 @@ import inspect
 import re
 import typing as t
 from collections import defaultdict
+from functools import lru_cache
 
 from ellar.common.constants import (
     ROUTE_OPENAPI_PARAMETERS,
@@ -129,6 +130,15 @@ def process_parameter_file(
     return param_field
 
 
+@lru_cache(1200)
+def _get_convertor_return_type(convertor_type: t.Type[Convertor]) -> t.Any:
+    _converter_signature = inspect.signature(convertor_type.convert)
+    assert (
+        _converter_signature.return_annotation is not inspect.Parameter.empty
+    ), f"{convertor_type.__name__} Convertor must have return type"
+    return _converter_signature.return_annotation
+
+
 class EndpointArgsModel:
     _provider_skip = primitive_types + sequence_types
 
@@ -186,14 +196,9 @@ class EndpointArgsModel:
     def get_convertor_model_field(
         cls, param_name: str, convertor: Convertor
     ) -> ModelField:
-        _converter_signature = inspect.signature(convertor.convert)
-        assert (
-            _converter_signature.return_annotation is not inspect.Parameter.empty
-        ), f"{convertor.__class__.__name__} Convertor must have return type"
-        _type = _converter_signature.return_annotation
         return get_parameter_field(
             param_default=params.PathFieldInfo(),
-            param_annotation=_type,
+            param_annotation=_get_convertor_return_type(type(convertor)),
             default_field_info=params.PathFieldInfo,
             param_name=param_name,
         )
@@ -47,7 +47,7 @@ class JSONResponseModel(ResponseModel):
         )
         json_response_class = t.cast(
             t.Type[JSONResponse],
-            context.get_app().config.DEFAULT_JSON_CLASS or self._response_type,
+            context.get_json_response_class() or self._response_type,
         )
         response_args, headers = self.get_context_response(
             context=context, status_code=status_code
@@ -159,6 +159,10 @@ class ConfigSchema(Serializer, ConfigDefaultTypesMixin):
 
     REDIRECT_SLASHES: bool = False
 
+    # Number of worker threads available for running sync route handlers.
+    # `None` keeps anyio default thread limiter capacity of 40 threads.
+    THREADPOOL_TOKENS: t.Optional[int] = None
+
     STATIC_FOLDER_PACKAGES: t.Optional[t.List[t.Union[str, t.Tuple[str, str]]]] = []
 
     STATIC_DIRECTORIES: t.Optional[t.List[t.Union[str, t.Any]]] = []
@@ -245,6 +249,12 @@ class ConfigSchema(Serializer, ConfigDefaultTypesMixin):
             assert value.startswith("/"), "Routed paths must start with '/'"
         return value
 
+    @field_validator("THREADPOOL_TOKENS")
+    def threadpool_tokens_validate(cls, value: t.Optional[int]) -> t.Optional[int]:
+        if value is not None and value < 1:
+            raise ValueError("THREADPOOL_TOKENS must be a positive integer")
+        return value
+
     @field_validator("CACHES", mode="before")
     def pre_cache_validate(cls, value: t.Dict) -> t.Any:
         if value and not value.get("default"):
@@ -1,4 +1,5 @@
 import typing as t
+from types import ModuleType
 
 from ellar.common.constants import ELLAR_CONFIG_MODULE
 from ellar.common.types import VT
@@ -12,10 +13,34 @@ class ConfigRuntimeError(RuntimeError):
     pass
 
 
+def _load_config_module(config_module: t.Optional[str], prefix: str) -> dict:
+    data = {}
+    _prefix = prefix.upper()
+
+    if config_module:
+        try:
+            mod = import_from_string(config_module)
+            if isinstance(mod, ModuleType):
+                settings = vars(mod).items()
+            else:
+                # config classes can inherit settings from their base classes
+                settings = ((name, getattr(mod, name)) for name in dir(mod))
+
+            prefix_length = len(_prefix)
+            for setting, value in settings:
+                if setting.isupper() and setting.startswith(_prefix):
+                    data[setting[prefix_length:]] = value
+        except Exception as ex:
+            raise ConfigRuntimeError(str(ex)) from ex
+
+    return data
+
+
 class Config(ConfigDefaultTypesMixin):
     __slots__ = (
         "_config_module",
         "_schema",
+        "_values",
     )
 
     _initialized: bool = False
@@ -30,9 +55,11 @@ class Config(ConfigDefaultTypesMixin):
         Creates a new instance of a Configuration object with the given values.
         """
 
+        # settings read cache, see `__getattr__`
+        self._values: t.Dict[str, t.Any] = {}
         self._config_module = config_module or environ.get(ELLAR_CONFIG_MODULE, None)
 
-        data = self._load_config_module(config_prefix or "")
+        data = _load_config_module(self._config_module, config_prefix or "")
         data.update(**mapping)
 
         self._schema = ConfigSchema.model_validate(data, from_attributes=True)
@@ -42,21 +69,6 @@ class Config(ConfigDefaultTypesMixin):
     def config_module(self) -> t.Optional[str]:
         return self._config_module
 
-    def _load_config_module(self, prefix: str) -> dict:
-        data = {}
-        _prefix = prefix.upper()
-
-        if self._config_module:
-            try:
-                mod = import_from_string(self._config_module)
-                for setting in dir(mod):
-                    if setting.isupper() and setting.startswith(_prefix):
-                        data[setting.replace(_prefix, "")] = getattr(mod, setting)
-            except Exception as ex:
-                raise ConfigRuntimeError(str(ex)) from ex
-
-        return data
-
     def __repr__(self) -> str:  # pragma: no cover
         hidden_values = {key: "..." for key in self._schema.serialize().keys()}
         return f"<Configuration {repr(hidden_values)}, settings_module: {self._config_module}>"
@@ -82,18 +94,25 @@ class Config(ConfigDefaultTypesMixin):
             super().__setattr__(key, value)
         else:
             setattr(self._schema, key, value)
+            self._values.pop(key, None)
 
     def __delattr__(self, key: t.Any) -> None:
         if key in self.__slots__ + ("_initialized",):
             # TODO: add test
             raise TypeError("can't delete config attributes.")
         delattr(self._schema, key)
+        self._values.pop(key, None)
 
     def __getattr__(self, key: t.Any) -> t.Any:
+        values = self._values
+        if key in values:
+            return values[key]
+
         value = getattr(self._schema, key)
         if isinstance(value, (list, set, tuple, dict)):
             # return immutable value
             return type(value)(value)
+        values[key] = value
         return value
 
     def set_defaults(self, **kwargs: t.Any) -> "Config":
@@ -101,6 +120,7 @@ class Config(ConfigDefaultTypesMixin):
             orig_value = getattr(self._schema, k, None)
             if orig_value is None:
                 setattr(self._schema, k, v)
+                self._values.pop(k, None)
         return self
 
     def get(self, key: t.Any, _default: t.Optional[t.Any] = None) -> t.Optional[t.Any]:
@@ -100,6 +100,9 @@ class ConfigDefaultTypesMixin:
     CORS_EXPOSE_HEADERS: t.Sequence[str]
     CORS_MAX_AGE: int
 
+    # Number of worker threads available for running sync route handlers
+    THREADPOOL_TOKENS: t.Optional[int]
+
     # TrustHostMiddleware setup
     ALLOWED_HOSTS: t.List[str]
     REDIRECT_HOST: bool
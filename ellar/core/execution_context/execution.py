@@ -4,16 +4,25 @@ from ellar.common.interfaces import IExecutionContext
 from ellar.common.models import ControllerBase
 from ellar.common.types import TReceive, TScope, TSend
 from ellar.core.services.reflector import Reflector
+from starlette.responses import Response
 
 from .host import HostContext
 
+if t.TYPE_CHECKING:  # pragma: no cover
+    from .factory import ExecutionContextFactory
+
 
 class ExecutionContext(HostContext, IExecutionContext):
     """
     Context for route functions and controllers
     """
 
-    __slots__ = ("_operation_handler", "reflector", "_handler_controller_class")
+    __slots__ = (
+        "_operation_handler",
+        "reflector",
+        "_handler_controller_class",
+        "_context_factory",
+    )
 
     def __init__(
         self,
@@ -24,10 +33,12 @@ class ExecutionContext(HostContext, IExecutionContext):
         operation_handler: t.Callable,
         operation_handler_type: t.Type,
         reflector: Reflector,
+        context_factory: t.Optional["ExecutionContextFactory"] = None,
     ) -> None:
         super(ExecutionContext, self).__init__(scope=scope, receive=receive, send=send)
         self._operation_handler = operation_handler
         self.reflector = reflector
+        self._context_factory = context_factory
 
         self._handler_controller_class: t.Optional[t.Type["ControllerBase"]] = t.cast(
             t.Optional[t.Type["ControllerBase"]], operation_handler_type
@@ -39,3 +50,8 @@ class ExecutionContext(HostContext, IExecutionContext):
 
     def get_class(self) -> t.Optional[t.Type["ControllerBase"]]:
         return self._handler_controller_class
+
+    def get_json_response_class(self) -> t.Optional[t.Type[Response]]:
+        if self._context_factory is None:
+            return super().get_json_response_class()
+        return self._context_factory.get_json_response_class(self)
@@ -1,6 +1,6 @@
 import typing as t
 
-from ellar.common.constants import empty_receive, empty_send
+from ellar.common.constants import NOT_SET, empty_receive, empty_send
 from ellar.common.exceptions import HostContextException
 from ellar.common.interfaces import (
     IExecutionContext,
@@ -11,6 +11,7 @@ from ellar.common.interfaces import (
     IWebSocketContextFactory,
 )
 from ellar.common.types import TReceive, TScope, TSend
+from ellar.core.conf import Config
 from ellar.core.services import Reflector
 from ellar.di import injectable
 
@@ -21,6 +22,7 @@ from .websocket import WebSocketHostContext
 
 if t.TYPE_CHECKING:  # pragma: no cover
     from ellar.core.routing import RouteOperationBase
+    from starlette.responses import Response
 
 
 @injectable()
@@ -60,10 +62,26 @@ class HostContextFactory(IHostContextFactory):
 
 @injectable()
 class ExecutionContextFactory(IExecutionContextFactory):
-    __slots__ = ("reflector",)
+    __slots__ = ("reflector", "_config", "_json_response_class")
 
-    def __init__(self, reflector: Reflector) -> None:
+    def __init__(self, reflector: Reflector, config: t.Optional[Config] = None) -> None:
         self.reflector = reflector
+        self._config = config
+        self._json_response_class: t.Any = NOT_SET
+
+    def get_json_response_class(
+        self, context: IExecutionContext
+    ) -> t.Optional[t.Type["Response"]]:
+        """
+        Resolves `DEFAULT_JSON_CLASS` on first use and keeps it
+        for every execution context created by this factory.
+        """
+        if self._json_response_class is NOT_SET:
+            config = (
+                self._config if self._config is not None else context.get_app().config
+            )
+            self._json_response_class = config.DEFAULT_JSON_CLASS
+        return t.cast(t.Optional[t.Type["Response"]], self._json_response_class)
 
     def create_context(
         self,
@@ -79,6 +97,7 @@ class ExecutionContextFactory(IExecutionContextFactory):
             operation_handler=operation.endpoint,
             operation_handler_type=operation.get_controller_type(),
             reflector=self.reflector,
+            context_factory=self,
         )
 
         return i_execution_context
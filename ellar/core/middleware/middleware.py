@@ -1,5 +1,6 @@
 import inspect
 import typing as t
+from functools import lru_cache
 
 from ellar.common.interfaces import IEllarMiddleware
 from ellar.common.types import ASGIApp
@@ -11,6 +12,25 @@ from starlette.middleware import Middleware
 T = t.TypeVar("T")
 
 
+@lru_cache(1200)
+def _get_injectable_parameters(cls: t.Type) -> t.Tuple[t.Tuple[str, t.Any], ...]:
+    """Returns `__init__` parameters of `cls` to be resolved from the injector"""
+    init_method = getattr(cls, "__init__", None)
+    if init_method is None:
+        return ()
+
+    spec = inspect.signature(init_method)
+    type_hints = _infer_injected_bindings(init_method, only_explicit_bindings=False)
+
+    result = []
+    for k, annotation in type_hints.items():
+        parameter = spec.parameters.get(k)
+        if parameter and parameter.default is None:
+            continue
+        result.append((k, annotation))
+    return tuple(result)
+
+
 class EllarMiddleware(Middleware, IEllarMiddleware):
     @t.no_type_check
     def __init__(
@@ -32,18 +52,8 @@ class EllarMiddleware(Middleware, IEllarMiddleware):
     def create_object(self, **init_kwargs: t.Any) -> t.Any:
         _result = dict(init_kwargs)
 
-        init_method = getattr(self.cls, "__init__", None)
-        if init_method is not None:
-            spec = inspect.signature(init_method)
-            type_hints = _infer_injected_bindings(
-                init_method, only_explicit_bindings=False
-            )
-
-            for k, annotation in type_hints.items():
-                parameter = spec.parameters.get(k)
-                if k in _result or (parameter and parameter.default is None):
-                    continue
-
+        for k, annotation in _get_injectable_parameters(self.cls):
+            if k not in _result:
                 _result[k] = current_injector.get(annotation)
 
         return self.cls(**_result)  # type: ignore[call-arg]
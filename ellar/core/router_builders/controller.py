@@ -53,12 +53,14 @@ def process_controller_routes(controller: t.Type[ControllerBase]) -> t.List[Base
                 )
                 continue
 
-            reflect.define_metadata(
-                constants.CONTROLLER_OPERATION_HANDLER_KEY,
-                [operation],
-                controller,
-            )
             res.append(operation)
+
+    if res:
+        reflect.define_metadata(
+            constants.CONTROLLER_OPERATION_HANDLER_KEY,
+            list(res),
+            controller,
+        )
     return res
 
 
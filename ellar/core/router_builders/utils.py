@@ -47,14 +47,15 @@ def process_nested_routes(controller: t.Type[t.Any]) -> t.List[BaseRoute]:
         factory_builder.check_type(item.router)
 
         operation = factory_builder.build(item.router, **kw)
+        res.append(operation)
+
+    if res:
         reflect.define_metadata(
             constants.CONTROLLER_OPERATION_HANDLER_KEY,
-            [operation],
+            list(res),
             controller,
         )
 
-        res.append(operation)
-
     _stack_cycle = tuple(_stack_cycle[:-1])
     return res
 
@@ -107,11 +108,13 @@ def build_route_parameters(
         if constants.ROUTE_OPERATION_PARAMETERS in item.endpoint.__dict__:
             del item.endpoint.__dict__[constants.ROUTE_OPERATION_PARAMETERS]
 
-        if operation.router_reflect_key is not constants.NOT_SET:
-            reflect.define_metadata(
-                constants.CONTROLLER_OPERATION_HANDLER_KEY,
-                [operation],
-                operation.router_reflect_key,
-            )
+    if results and controller_type is not constants.NOT_SET:
+        # one merge for the whole batch instead of copying the
+        # accumulated list on every route
+        reflect.define_metadata(
+            constants.CONTROLLER_OPERATION_HANDLER_KEY,
+            list(results),
+            controller_type,
+        )
 
     return results
@@ -8,6 +8,7 @@ except Exception:  # pragma: no cover
 import typing as t
 
 from ellar.utils.crypto import get_random_string
+from starlette.concurrency import run_in_threadpool
 
 from .argon2 import Argon2Hasher
 from .base import BaseHasher, EncodingType
@@ -41,9 +42,14 @@ def get_hasher(algorithm: str = "pbkdf2_sha256") -> "BaseHasher":
 
 
 def identify_hasher(encoded: str) -> "BaseHasher":
-    possible_hashers = [v for k, v in __HASHERS_DICT.items() if v.identity(encoded)]
-    if possible_hashers:
-        return possible_hashers[0]()
+    # most encoded values are prefixed with the hasher algorithm, e.g. `pbkdf2_sha256$...`
+    hasher_type = __HASHERS_DICT.get(encoded.partition("$")[0])
+    if hasher_type is not None and hasher_type.identity(encoded):
+        return hasher_type()
+
+    for hasher_type in __HASHERS_DICT.values():
+        if hasher_type.identity(encoded):
+            return hasher_type()
     raise ValueError("Unable to identify Hasher")
 
 
@@ -99,15 +105,23 @@ def check_password(
     if password is None or not is_password_usable(encoded):
         return False
 
-    preferred = get_hasher(preferred_algorithm)
-    try:
-        hasher = identify_hasher(encoded)
-    except ValueError:
-        # encoded is gibberish or uses a hasher that's no longer installed.
-        return False
-
-    hasher_changed = hasher.algorithm != preferred.algorithm
-    must_update: bool = hasher_changed or preferred.must_update(encoded)
+    if preferred_algorithm not in __HASHERS_DICT:
+        get_hasher(preferred_algorithm)  # raises for unknown algorithm
+
+    preferred_type = __HASHERS_DICT[preferred_algorithm]
+    if preferred_type.identity(encoded):
+        # steady state: the password is already hashed with the preferred algorithm
+        hasher = preferred_type()
+        hasher_changed = False
+    else:
+        try:
+            hasher = identify_hasher(encoded)
+        except ValueError:
+            # encoded is gibberish or uses a hasher that's no longer installed.
+            return False
+        hasher_changed = hasher.algorithm != preferred_algorithm
+
+    must_update: bool = hasher_changed or hasher.must_update(encoded)
     is_correct: bool = hasher.verify(password, encoded)
 
     if setter and is_correct and must_update:
@@ -115,6 +129,43 @@ def check_password(
     return is_correct
 
 
+async def make_password_async(
+    password: t.Optional[EncodingType],
+    algorithm: str = "pbkdf2_sha256",
+    salt: t.Optional[str] = None,
+) -> str:
+    """
+    Same as `make_password` but hashes the password in a worker thread,
+    so CPU bound hashing doesn't block the event loop.
+    """
+    return await run_in_threadpool(make_password, password, algorithm, salt)
+
+
+async def check_password_async(
+    password: EncodingType,
+    encoded: str,
+    setter: t.Optional[t.Callable[..., t.Any]] = None,
+    preferred_algorithm: str = "pbkdf2_sha256",
+) -> bool:
+    """
+    Same as `check_password` but verifies the password in a worker thread,
+    so CPU bound hashing doesn't block the event loop.
+
+    `setter` is still called from the event loop.
+    """
+    must_update: t.List[EncodingType] = []
+    is_correct = await run_in_threadpool(
+        check_password,
+        password,
+        encoded,
+        must_update.append if setter else None,
+        preferred_algorithm,
+    )
+    if setter and must_update:
+        setter(*must_update)
+    return is_correct
+
+
 add_hasher(
     PBKDF2Hasher,
     PBKDF2SHA1Hasher,
@@ -135,7 +186,9 @@ __all__ = [
     "ScryptHasher",
     "MD5Hasher",
     "make_password",
+    "make_password_async",
     "check_password",
+    "check_password_async",
     "is_password_usable",
     "get_hasher",
     "identify_hasher",
@@ -1,4 +1,5 @@
 import typing as t
+from functools import partial
 
 from ellar.common.interfaces import IAPIVersioning
 from ellar.common.types import TScope
@@ -24,13 +25,15 @@ class BaseAPIVersioning(IAPIVersioning):
     ):
         self.version_parameter = version_parameter
         self.default_version = default_version
+        resolver_class: t.Callable[..., BaseAPIVersioningResolver] = self.resolver_class
+        self._resolver_factory = partial(
+            resolver_class,
+            version_parameter=version_parameter,
+            default_version=default_version,
+        )
 
     def get_version_resolver(self, scope: TScope) -> BaseAPIVersioningResolver:
-        return self.resolver_class(
-            scope=scope,
-            version_parameter=self.version_parameter,
-            default_version=self.default_version,
-        )
+        return self._resolver_factory(scope=scope)
 
 
 class DefaultAPIVersioning(BaseAPIVersioning):
@@ -61,14 +64,8 @@ class HeaderAPIVersioning(BaseAPIVersioning):
     def __init__(self, header_parameter: str = "accept", **kwargs: t.Any) -> None:
         super().__init__(**kwargs)
         self.header_parameter = header_parameter
-
-    def get_version_resolver(self, scope: TScope) -> BaseAPIVersioningResolver:
-        resolver_class = t.cast(t.Type[HeaderVersionResolver], self.resolver_class)
-        return resolver_class(
-            scope=scope,
-            header_parameter=self.header_parameter,
-            version_parameter=self.version_parameter,
-            default_version=self.default_version,
+        self._resolver_factory = partial(
+            self._resolver_factory, header_parameter=header_parameter
         )
 
 
@@ -2,15 +2,24 @@ import email
 import re
 import typing as t
 from abc import abstractmethod
+from functools import lru_cache
 
 from ellar.common.constants import NOT_SET
 from ellar.common.exceptions import NotAcceptable, NotFound
 from ellar.common.interfaces import IAPIVersioningResolver
 from ellar.common.types import TScope
 from ellar.core.connection import HTTPConnection
+from starlette.convertors import Convertor
 from starlette.routing import compile_path
 
 
+@lru_cache(1200)
+def _compile_version_path(
+    version_parameter: str,
+) -> t.Tuple[t.Pattern, str, t.Dict[str, Convertor]]:
+    return compile_path("/{" + version_parameter + "}/{path:path}")
+
+
 class BaseAPIVersioningResolver(IAPIVersioningResolver):
     def __init__(
         self, *, scope: TScope, version_parameter: str, default_version: t.Optional[str]
@@ -64,17 +73,15 @@ class DefaultAPIVersionResolver(BaseAPIVersioningResolver):
 
 class UrlPathVersionResolver(DefaultAPIVersionResolver):
     invalid_version_message = "Invalid version in URL path."
+    # we expected v[1-9] or (1-9).(1-9) as outcome of the result
+    # to tell when a version is part of the url
+    version_regex = re.compile("(/?(v)?[1-9]?(.[0-9]))", re.IGNORECASE)
 
     def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
         super(UrlPathVersionResolver, self).__init__(*args, **kwargs)
-
-        prefix = "/{" + self.version_parameter + "}"
-        self.path_regex, self.path_format, self.param_convertors = compile_path(
-            prefix + "/{path:path}"
+        self.path_regex, self.path_format, self.param_convertors = (
+            _compile_version_path(self.version_parameter)
         )
-        # we expected v[1-9] or (1-9).(1-9) as outcome of the result
-        # to tell when a version is part of the url
-        self.version_regex = re.compile("(/?(v)?[1-9]?(.[0-9]))", re.IGNORECASE)
 
     def _resolve_url_prefix(self) -> t.Optional[str]:
         """Since we expect a extra parameter that is not path any router routes,
@@ -1,5 +1,4 @@
 import typing as t
-from weakref import WeakKeyDictionary
 
 from ellar.di.service_config import (
     ProviderConfig,
@@ -9,10 +8,18 @@ if t.TYPE_CHECKING:  # pragma: no cover
     from ellar.core.modules import ModuleForwardRef, ModuleRefBase, ModuleSetup
 
 
-class TreeData(t.NamedTuple):
-    value: t.Union["ModuleRefBase", "ModuleSetup", "ModuleForwardRef"]
-    parent: t.Optional[t.Type]
-    dependencies: t.List[t.Union[t.Any, t.Type]]
+class TreeData:
+    __slots__ = ("value", "parent", "dependencies")
+
+    def __init__(
+        self,
+        value: t.Union["ModuleRefBase", "ModuleSetup", "ModuleForwardRef"],
+        parent: t.Optional[t.Type],
+        dependencies: t.List[t.Union[t.Any, t.Type]],
+    ) -> None:
+        self.value = value
+        self.parent = parent
+        self.dependencies = dependencies
 
     @property
     def is_ready(self) -> bool:
@@ -42,17 +49,24 @@ class TreeData(t.NamedTuple):
 
 
 class ModuleTreeManager:
-    __slots__ = ("modules", "_core_module", "_app_module", "_forward_refs")
+    __slots__ = (
+        "modules",
+        "_core_module",
+        "_app_module",
+        "_forward_refs",
+        "_ref_type_index",
+    )
 
     # , root_module: t.Union["ModuleRefBase", "ModuleSetup"]
     def __init__(
         self,
         app_core_module: t.Optional[t.Union["ModuleRefBase", "ModuleSetup"]] = None,
     ) -> None:
-        self.modules: t.MutableMapping[t.Type, TreeData] = (
-            WeakKeyDictionary()
-        )  # Dictionary to store modules by their ID or value
+        # Modules by type. The manager lives as long as the app, as do the module types.
+        self.modules: t.Dict[t.Type, TreeData] = {}
         self._forward_refs: t.MutableMapping["ModuleForwardRef", TreeData] = {}
+        # modules grouped by `ref_type`, built on demand and reset when modules change
+        self._ref_type_index: t.Optional[t.Dict[str, t.List[TreeData]]] = None
 
         self._core_module = app_core_module.module if app_core_module else None
         self._app_module: t.Optional[t.Type[t.Any]] = None
@@ -94,31 +108,28 @@ class ModuleTreeManager:
 
         data = TreeData(value=value, parent=parent_module, dependencies=[])
 
-        self.modules[module_type] = data
+        if parent_module is None:
+            self._add_root_module(module_type, data)
+            return self
 
-        if parent_module:
-            if parent_module not in self.modules:
-                raise ValueError(
-                    f"Parent data for Module {parent_module} does not exist."
-                )
+        parent = self.modules.get(parent_module)
+        if parent is None:
+            raise ValueError(f"Parent data for Module {parent_module} does not exist.")
 
-            self.modules[parent_module].dependencies.append(module_type)
+        self.modules[module_type] = data
+        self._ref_type_index = None
+        parent.dependencies.append(module_type)
 
-            if parent_module == self._core_module and not self._app_module:
-                self._app_module = data.value.module
+        if parent_module is self._core_module and self._app_module is None:
+            self._app_module = data.value.module
+        return self
+
+    def _add_root_module(self, module_type: t.Type, data: TreeData) -> None:
+        self.modules[module_type] = data
+        self._ref_type_index = None
 
-        elif not parent_module and not self._app_module and not self._core_module:
+        if self._app_module is None and self._core_module is None:
             self._app_module = module_type
-        elif (
-            self._app_module
-            and parent_module
-            and self._core_module
-            and parent_module == self._core_module
-        ):
-            raise Exception(
-                f"EllarCoreModule can only have '{self._app_module}' as dependency"
-            )
-        return self
 
     def add_forward_ref(
         self,
@@ -172,6 +183,7 @@ class ModuleTreeManager:
             dependencies=data.dependencies,
         )
         self.modules[module_type] = new_module_data
+        self._ref_type_index = None
         return self
 
     def add_or_update(
@@ -180,11 +192,18 @@ class ModuleTreeManager:
         value: t.Union["ModuleRefBase", "ModuleSetup"],
         parent_module: t.Optional[t.Type] = None,
     ) -> "ModuleTreeManager":
-        try:
-            self.add_module(module_type, value, parent_module)
-        except ValueError:
-            self.update_module(module_type, value, parent_module)
-        return self
+        if module_type in self.modules:
+            return self.update_module(module_type, value, parent_module)
+
+        if parent_module is not None and parent_module not in self.modules:
+            # parent is not registered (yet), keep the module without linking it
+            self.modules[module_type] = TreeData(
+                value=value, parent=parent_module, dependencies=[]
+            )
+            self._ref_type_index = None
+            return self
+
+        return self.add_module(module_type, value, parent_module)
 
     def get_module(self, module_type: t.Type) -> t.Optional[TreeData]:
         try:
@@ -196,7 +215,13 @@ class ModuleTreeManager:
             return None
 
     def get_by_ref_type(self, ref_type: str) -> t.List[t.Union[TreeData, t.Any]]:
-        return [v for k, v in self.modules.items() if v.ref_type == ref_type]
+        index = self._ref_type_index
+        if index is None:
+            index = {}
+            for data in self.modules.values():
+                index.setdefault(data.value.ref_type, []).append(data)
+            self._ref_type_index = index
+        return list(index.get(ref_type, ()))
 
     def get_module_dependencies(
         self,
@@ -250,28 +275,30 @@ class ModuleTreeManager:
         :param find_predicate:
         :return: The node with the given ID, or None if not found.
         """
-        _stack_cycle: t.Tuple[t.Any] = ()  # type:ignore[assignment]
-
-        def dfs(current_node: TreeData) -> t.Optional[TreeData]:
-            nonlocal _stack_cycle
-            _stack_cycle += (current_node.value.module,)  # type:ignore[assignment]
-
-            if find_predicate(current_node):
-                return current_node
-
-            for child_id in current_node.dependencies:
-                child_node = self.get_module(child_id)
-                if child_node and child_node.value.module not in _stack_cycle:
-                    res = dfs(child_node)
-                    if res:
-                        return res
-            return None
+        get_module = self.get_module
+        visited: t.Set[t.Any] = set()
 
         # Start DFS from each root node in the tree (nodes with no parents)
         for module in self.find_module(filter_item):
-            result = dfs(module)
-            if result:
-                return result
+            if module is None:
+                continue
+
+            stack = [module]
+            while stack:
+                current_node = stack.pop()
+                module_type = current_node.value.module
+                if module_type in visited:
+                    continue
+                visited.add(module_type)
+
+                if find_predicate(current_node):
+                    return current_node
+
+                # reversed, so children are visited in their declared order
+                for child_id in reversed(current_node.dependencies):
+                    child_node = get_module(child_id)
+                    if child_node and child_node.value.module not in visited:
+                        stack.append(child_node)
         return None
 
     def __repr__(self) -> str:  # pragma: no cover
@@ -32,6 +32,8 @@ __all__ = (
     "InjectByTag",
 )
 
+_NOT_SET = object()
+
 
 class ProviderConfig(t.Generic[T]):
     """
@@ -131,11 +133,10 @@ class ProviderConfig(t.Generic[T]):
 
     def register(self, container: "Container") -> None:
         base_type = self.get_type()
-        scope = get_scope(base_type) or self.scope
         use_class = self.get_use_class()
 
         if use_class:
-            scope = get_scope(use_class) or scope
+            scope = get_scope(use_class) or get_scope(base_type) or self.scope
             container.register(
                 base_type=base_type,
                 concrete_type=use_class,
@@ -146,7 +147,7 @@ class ProviderConfig(t.Generic[T]):
             container.register(
                 base_type=base_type,
                 concrete_type=self.use_value,
-                scope=scope,
+                scope=get_scope(base_type) or self.scope,
                 tag=self.tag,
             )
         elif not isinstance(base_type, type):
@@ -156,7 +157,11 @@ class ProviderConfig(t.Generic[T]):
                 f"Module to configure the provider"
             )
         else:
-            container.register(base_type=base_type, scope=scope, tag=self.tag)
+            container.register(
+                base_type=base_type,
+                scope=get_scope(base_type) or self.scope,
+                tag=self.tag,
+            )
 
 
 @t.overload
@@ -192,7 +197,9 @@ def injectable(
     """
 
     def _decorator(func_or_class: ConstructorOrClassT) -> ConstructorOrClassT:
-        fail_silently(inject, constructor_or_class=func_or_class)
+        if not has_binding(func_or_class):
+            # `__init__` inherited from an injectable base already has its bindings
+            fail_silently(inject, constructor_or_class=func_or_class)
         setattr(func_or_class, INJECTABLE_ATTRIBUTE, scope)
 
         reflect.define_metadata(INJECTABLE_WATERMARK, True, func_or_class)
@@ -245,14 +252,11 @@ def get_scope(
     func_or_class: ConstructorOrClassT,
 ) -> t.Optional[t.Union[t.Type[Scope], ScopeDecorator]]:
     """Get scope declared scope if available in a type or callable"""
-    return t.cast(
-        t.Optional[t.Union[t.Type[Scope], ScopeDecorator]],
-        getattr(
-            func_or_class,
-            INJECTABLE_ATTRIBUTE,
-            getattr(func_or_class, "__scope__", None),
-        ),
-    )
+    scope = getattr(func_or_class, INJECTABLE_ATTRIBUTE, _NOT_SET)
+    if scope is _NOT_SET:
+        # fallback to `__scope__` only when `injectable` scope is not defined
+        scope = getattr(func_or_class, "__scope__", None)
+    return t.cast(t.Optional[t.Union[t.Type[Scope], ScopeDecorator]], scope)
 
 
 def InjectByTag(tag: str) -> t.Any:
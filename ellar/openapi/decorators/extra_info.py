@@ -1,4 +1,5 @@
 import typing as t
+from functools import lru_cache
 
 from ellar.common.compatible import AttributeDict
 from ellar.common.decorators import set_metadata as set_meta
@@ -6,6 +7,27 @@ from ellar.common.exceptions import ImproperConfiguration
 from ellar.openapi.constants import OPENAPI_OPERATION_KEY
 
 
+@lru_cache(1200)
+def _get_api_info_decorator(
+    operation_id: t.Optional[str],
+    summary: t.Optional[str],
+    description: t.Optional[str],
+    tags: t.Optional[t.Tuple[str, ...]],
+    deprecated: t.Optional[bool],
+) -> t.Callable:
+    """Shares one metadata decorator between endpoints with the same api_info"""
+    return set_meta(
+        OPENAPI_OPERATION_KEY,
+        AttributeDict(
+            operation_id=operation_id,
+            summary=summary,
+            description=description,
+            deprecated=deprecated,
+            tags=list(tags) if tags is not None else None,
+        ),
+    )
+
+
 def api_info(
     operation_id: t.Optional[str] = None,
     summary: t.Optional[str] = None,
@@ -28,6 +50,15 @@ def api_info(
     if tags and not isinstance(tags, list):
         raise ImproperConfiguration("tags must be a sequence of str eg, [tagA, tagB]")
 
+    if not kwargs:
+        return _get_api_info_decorator(
+            operation_id,
+            summary,
+            description,
+            tuple(tags) if tags is not None else None,
+            deprecated,
+        )
+
     return set_meta(
         OPENAPI_OPERATION_KEY,
         AttributeDict(
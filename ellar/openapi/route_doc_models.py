@@ -1,5 +1,6 @@
 import typing as t
 from abc import ABC, abstractmethod
+from itertools import chain
 
 from ellar.common.compatible import AttributeDict, cached_property
 from ellar.common.constants import (
@@ -35,6 +36,18 @@ from starlette.status import HTTP_422_UNPROCESSABLE_ENTITY
 if t.TYPE_CHECKING:  # pragma: no cover
     from ellar.common import GuardCanActivate
 
+_HTTP_422 = str(HTTP_422_UNPROCESSABLE_ENTITY)
+
+
+def _get_http_422_response() -> t.Dict[str, t.Any]:
+    # a new object per operation, returned operations may be edited by callers
+    return {
+        "description": "Validation Error",
+        "content": {
+            "application/json": {"schema": {"$ref": REF_PREFIX + "HTTPValidationError"}}
+        },
+    }
+
 
 class OpenAPIRoute(ABC):
     @abstractmethod
@@ -127,10 +140,9 @@ class OpenAPIMountDocumentation(OpenAPIRoute):
 
     @cached_property
     def _openapi_models(self) -> t.List[ModelField]:
-        _models = []
-        for route in self.routes:
-            _models.extend(route.get_route_models())
-        return _models
+        return list(
+            chain.from_iterable(route.get_route_models() for route in self.routes)
+        )
 
     def get_route_models(self) -> t.List[t.Union[ModelField, RouteParameterModelField]]:
         """Should return input fields and output fields"""
@@ -188,13 +200,21 @@ class OpenAPIRouteDocumentation(OpenAPIRoute):
         self.guards = guards or []
         self._operation_extra = operation_extra
 
+    @cached_property
+    def _body_model_field(self) -> t.Optional[ModelField]:
+        body_resolver = self.route.endpoint_parameter_model.body_resolver
+        return body_resolver.model_field if body_resolver else None
+
     @cached_property
     def _openapi_models(self) -> t.List[t.Union[ModelField, RouteParameterModelField]]:
-        _models: t.List[ModelField] = self.input_fields + self.output_fields
-        if self.route.endpoint_parameter_model.body_resolver:
-            model_field = self.route.endpoint_parameter_model.body_resolver.model_field
-            _models.append(model_field)
-        return _models
+        body_model_field = self._body_model_field
+        return list(
+            chain(
+                self.input_fields,
+                self.output_fields,
+                (body_model_field,) if body_model_field is not None else (),
+            )
+        )
 
     @cached_property
     def input_fields(self) -> t.List[ModelField]:
@@ -225,11 +245,26 @@ class OpenAPIRouteDocumentation(OpenAPIRoute):
 
     @cached_property
     def output_fields(self) -> t.List[ModelField]:
-        _models: t.List[ModelField] = []
-        for _, model in self.route.response_model.models.items():
-            if model.get_model_field():
-                _models.append(model.get_model_field())  # type: ignore
-        return _models
+        return [
+            model_field
+            for _, _, _, model_field in self._response_templates
+            if model_field
+        ]
+
+    @cached_property
+    def _response_templates(
+        self,
+    ) -> t.List[t.Tuple[str, str, str, t.Optional[ModelField]]]:
+        """(status, description, media type, model field) of each response model"""
+        return [
+            (
+                str(status),
+                response_model.description,
+                response_model.media_type,
+                response_model.get_model_field(),
+            )
+            for status, response_model in self.route.response_model.models.items()
+        ]
 
     def get_route_models(self) -> t.List[ModelField]:
         """Should return input fields and output fields"""
@@ -255,7 +290,9 @@ class OpenAPIRouteDocumentation(OpenAPIRoute):
 
         return security_definitions, operation_security
 
-    def get_openapi_operation_metadata(self, method: str) -> t.Dict[str, t.Any]:
+    @cached_property
+    def _operation_metadata(self) -> t.Dict[str, t.Any]:
+        """Operation fields that are the same for every method of the route"""
         operation: t.Dict[str, t.Any] = {}
         if self.tags:
             operation["tags"] = self.tags
@@ -265,53 +302,67 @@ class OpenAPIRouteDocumentation(OpenAPIRoute):
         if self.description:
             operation["description"] = self.description
 
+        if self.deprecated:
+            operation["deprecated"] = self.deprecated
+
+        return operation
+
+    @cached_property
+    def _operation_id_controller(self) -> t.Any:
         ignore_controller = (
             reflector.get(IGNORE_CONTROLLER_TYPE, self.route.endpoint) or False
         )
+        return None if ignore_controller else self.route.router_reflect_key
 
-        operation["operationId"] = (
-            self.operation_id
-            or self.route.get_operation_unique_id(
-                methods=method,
-                controller=None if ignore_controller else self.route.router_reflect_key,
+    def get_openapi_operation_metadata(self, method: str) -> t.Dict[str, t.Any]:
+        operation = dict(self._operation_metadata)
+        operation["operationId"] = self.operation_id or (
+            self.route.get_operation_unique_id(
+                methods=method, controller=self._operation_id_controller
             )
         )
-        if self.deprecated:
-            operation["deprecated"] = self.deprecated
-
         return operation
 
-    def get_openapi_operation_parameters(
-        self,
-        *,
-        field_mapping: t.Dict[
-            t.Tuple[ModelField, t.Literal["validation", "serialization"]],
-            JsonSchemaValue,
-        ],
-    ) -> t.List[t.Dict[str, t.Any]]:
-        parameters: t.List[t.Dict[str, t.Any]] = []
+    @cached_property
+    def _parameter_templates(self) -> t.List[t.Tuple[ModelField, t.Dict[str, t.Any]]]:
+        """Parameter objects of `input_fields` without their schema"""
+        templates = []
         for param in self.input_fields:
-            field_info = param.field_info
-            field_info = t.cast(Param, field_info)
-            param_schema = get_schema_from_model_field(
-                field=param,
-                field_mapping=field_mapping,
-                separate_input_output_schemas=True,
-            )
-            parameter = {
+            field_info: Param = param.field_info  # type:ignore[assignment]
+            parameter: t.Dict[str, t.Any] = {
                 "name": param.alias,
                 "in": field_info.in_.value,
                 "required": param.required,
-                "schema": param_schema,
             }
             if field_info.description:
                 parameter["description"] = field_info.description
             if field_info.examples:  # pragma: no cover
-                parameter["examples"] = field_info.examples  # type:ignore[assignment]
+                parameter["examples"] = field_info.examples
             if field_info.deprecated:
-                parameter["deprecated"] = field_info.deprecated  # type:ignore[assignment]
-            parameters.append(parameter)
-        return parameters
+                parameter["deprecated"] = field_info.deprecated
+            templates.append((param, parameter))
+        return templates
+
+    def get_openapi_operation_parameters(
+        self,
+        *,
+        field_mapping: t.Dict[
+            t.Tuple[ModelField, t.Literal["validation", "serialization"]],
+            JsonSchemaValue,
+        ],
+    ) -> t.List[t.Dict[str, t.Any]]:
+        # a new dict per call, the cached templates are never handed out
+        return [
+            {
+                **parameter,
+                "schema": get_schema_from_model_field(
+                    field=param,
+                    field_mapping=field_mapping,
+                    separate_input_output_schemas=True,
+                ),
+            }
+            for param, parameter in self._parameter_templates
+        ]
 
     def get_openapi_operation_request_body(
         self,
@@ -321,10 +372,10 @@ class OpenAPIRouteDocumentation(OpenAPIRoute):
             JsonSchemaValue,
         ],
     ) -> t.Optional[t.Dict[str, t.Any]]:
-        if not self.route.endpoint_parameter_model.body_resolver:
+        model_field = self._body_model_field
+        if model_field is None:
             return None
 
-        model_field = self.route.endpoint_parameter_model.body_resolver.model_field
         assert isinstance(model_field, ModelField)
 
         body_schema = get_schema_from_model_field(
@@ -333,7 +384,7 @@ class OpenAPIRouteDocumentation(OpenAPIRoute):
             separate_input_output_schemas=True,
         )
 
-        field_info = t.cast(Body, model_field.field_info)
+        field_info: Body = model_field.field_info  # type:ignore[assignment]
         request_media_type = field_info.media_type
 
         request_body_oai: t.Dict[str, t.Any] = {}
@@ -357,70 +408,68 @@ class OpenAPIRouteDocumentation(OpenAPIRoute):
         path: t.Dict = {}
         security_schemes: t.Dict[str, t.Any] = {}
 
-        for method in self.route.methods:
-            operation = self.get_openapi_operation_metadata(method=method)
-            parameters: t.List[t.Dict[str, t.Any]] = []
-            operation_parameters = self.get_openapi_operation_parameters(
+        # everything below is the same for each method of the route,
+        # so it is computed once and copied into each method operation
+        parameters = list(
+            {
+                param["name"]: param
+                for param in self.get_openapi_operation_parameters(
+                    field_mapping=field_mapping,
+                )
+            }.values()
+        )
+        request_body_oai: t.Optional[t.Dict[str, t.Any]] = None
+        if METHODS_WITH_BODY.intersection(self.route.methods):
+            request_body_oai = self.get_openapi_operation_request_body(
                 field_mapping=field_mapping,
             )
-            parameters.extend(operation_parameters)
 
-            if parameters:
-                operation["parameters"] = list(
-                    {param["name"]: param for param in parameters}.values()
-                )
+        security_definitions, operation_security = self._get_openapi_security_scheme()
+        if security_definitions:
+            security_schemes.update(security_definitions)
 
-            if method in METHODS_WITH_BODY:
-                request_body_oai = self.get_openapi_operation_request_body(
+        response_schemas = [
+            (
+                status,
+                description,
+                media_type,
+                get_schema_from_model_field(
+                    field=model_field,
                     field_mapping=field_mapping,
+                    separate_input_output_schemas=True,
                 )
-                if request_body_oai:
-                    operation["requestBody"] = request_body_oai
+                if model_field
+                else {"type": "string"},
+            )
+            for status, description, media_type, model_field in (
+                self._response_templates
+            )
+        ]
+
+        for method in self.route.methods:
+            operation = self.get_openapi_operation_metadata(method=method)
+
+            if parameters:
+                operation["parameters"] = [dict(param) for param in parameters]
+
+            if request_body_oai and method in METHODS_WITH_BODY:
+                operation["requestBody"] = dict(request_body_oai)
 
-            (
-                security_definitions,
-                operation_security,
-            ) = self._get_openapi_security_scheme()
             if operation_security:
-                operation.setdefault("security", []).extend(operation_security)
-            if security_definitions:
-                security_schemes.update(security_definitions)
+                operation["security"] = list(operation_security)
 
             operation_responses = operation.setdefault("responses", {})
-            for status, response_model in self.route.response_model.models.items():
-                operation_responses_status = operation_responses.setdefault(
-                    str(status), {}
-                )
-                operation_responses_status["description"] = response_model.description
-
-                content = operation_responses_status.setdefault("content", {})
-                media_type = content.setdefault(response_model.media_type, {})
-                media_type.setdefault("schema", {"type": "string"})
-
-                model_field = response_model.get_model_field()
-                if model_field:
-                    model_field_schema = get_schema_from_model_field(
-                        field=model_field,
-                        field_mapping=field_mapping,
-                        separate_input_output_schemas=True,
-                    )
-                    media_type["schema"] = model_field_schema
-
-            http422 = str(HTTP_422_UNPROCESSABLE_ENTITY)
-            if (
-                parameters or self.route.endpoint_parameter_model.body_resolver
-            ) and not any(
-                status in operation["responses"]
-                for status in [http422, "4XX", "default"]
-            ):
-                operation["responses"][http422] = {
-                    "description": "Validation Error",
-                    "content": {
-                        "application/json": {
-                            "schema": {"$ref": REF_PREFIX + "HTTPValidationError"}
-                        }
-                    },
+            for status_code, description, media_type, schema in response_schemas:
+                operation_responses[status_code] = {
+                    "description": description,
+                    "content": {media_type: {"schema": schema}},
                 }
+
+            if (parameters or self._body_model_field is not None) and not any(
+                status in operation_responses
+                for status in (_HTTP_422, "4XX", "default")
+            ):
+                operation_responses[_HTTP_422] = _get_http_422_response()
             if self._operation_extra:
                 operation.update(self._operation_extra)
             path[method.lower()] = operation
@@ -193,13 +193,11 @@ class _Reflect:
         self, target: t.Union[t.Type, t.Callable], create: bool = False
     ) -> t.Optional[t.Dict]:
         _target = _get_actual_target(target)
-        if _target in self._meta_data:
-            return self._meta_data[_target]
+        target_metadata = self._meta_data.get(_target)
 
-        if create:
-            self._meta_data[_target] = {}
-            return self._meta_data[_target]
-        return None
+        if target_metadata is None and create:
+            target_metadata = self._meta_data[_target] = {}
+        return target_metadata
 
     def _clone_meta_data(
         self,
@@ -226,27 +224,30 @@ class _Reflect:
         reflect._meta_data = WeakKeyDictionary(dict=cached_meta_data)
 
 
+_DICT_TYPES = (dict, WeakKeyDictionary, WeakValueDictionary)
+
+# Update callbacks are dispatched on `type(existing_value)`,
+# so only `new_value` needs to be checked here.
+
+
 def _list_update(existing_value: t.Any, new_value: t.Any) -> t.Any:
-    if isinstance(existing_value, (list, tuple)) and isinstance(
-        new_value, (list, tuple)
-    ):
-        return existing_value + type(existing_value)(new_value)  # type: ignore
+    if isinstance(new_value, (list, tuple)):
+        return existing_value + type(existing_value)(new_value)
     return new_value
 
 
 def _set_update(existing_value: t.Any, new_value: t.Any) -> t.Any:
-    if isinstance(existing_value, set) and isinstance(new_value, set):
-        existing_combined = list(existing_value) + list(new_value)
-        return type(existing_value)(existing_combined)
+    if isinstance(new_value, set):
+        return type(existing_value)(existing_value | new_value)
     return new_value
 
 
 def _dict_update(existing_value: t.Any, new_value: t.Any) -> t.Any:
-    if isinstance(
-        existing_value, (dict, WeakKeyDictionary, WeakValueDictionary)
-    ) and isinstance(new_value, (dict, WeakKeyDictionary, WeakValueDictionary)):
-        existing_value.update(new_value)
-        return type(existing_value)(existing_value)
+    if isinstance(new_value, _DICT_TYPES):
+        # merge into a copy, metadata values may be shared between targets
+        merged_value = type(existing_value)(existing_value)
+        merged_value.update(new_value)
+        return merged_value
     return new_value
 
 
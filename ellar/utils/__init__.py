@@ -8,6 +8,7 @@ import uuid
 class_base_function_regex: t.Pattern[t.Any] = re.compile(
     "<\\w+ ((\\w+\\.(<\\w+>)\\.)+)?(\\w+)\\.(\\w+) at \\w+>", re.IGNORECASE
 )
+_operation_id_invalid_chars_regex: t.Pattern[str] = re.compile("[^0-9a-zA-Z_]")
 
 
 def generate_operation_unique_id(
@@ -19,7 +20,7 @@ def generate_operation_unique_id(
 ) -> str:
     _methods = "_".join(sorted(methods))
     operation_id = name + path
-    operation_id = re.sub("[^0-9a-zA-Z_]", "_", operation_id)
+    operation_id = _operation_id_invalid_chars_regex.sub("_", operation_id)
     operation_id = operation_id + "_" + _methods.lower()
 
     if isinstance(controller, type):
@@ -12,12 +12,17 @@ from ellar.common import (
 from ellar.core import ModuleBase
 from ellar.core.exceptions.service import ExceptionMiddlewareService
 from ellar.core.execution_context import ExecutionContext, HostContext
+from ellar.core.execution_context.factory import ExecutionContextFactory
 from ellar.core.services import Reflector
 from ellar.di import ProviderConfig, injectable, register_request_scope_context
 from ellar.reflect import reflect
 from ellar.testing import Test
 from starlette.exceptions import HTTPException
-from starlette.responses import PlainTextResponse
+from starlette.responses import JSONResponse, PlainTextResponse
+
+
+class CustomJSONResponse(JSONResponse):
+    pass
 
 
 @Controller
@@ -151,3 +156,22 @@ def test_can_replace_execution_context():
     assert res.text == '"NewExecutionContext"'
     new_ctx_instance = reflect.get_metadata("NewExecutionContext", NewExecutionContext)
     assert new_ctx_instance.worked is True
+
+
+def test_execution_context_factory_resolves_json_class_on_first_use():
+    tm = Test.create_test_module(
+        controllers=[ExampleController],
+        config_module={"DEFAULT_JSON_CLASS": CustomJSONResponse},
+    )
+    app = tm.create_application()
+
+    class Context:
+        def get_app(self):
+            return app
+
+    factory = ExecutionContextFactory(Reflector())
+    assert factory.get_json_response_class(Context()) is CustomJSONResponse
+
+    # resolved once per factory
+    app.config.DEFAULT_JSON_CLASS = JSONResponse
+    assert factory.get_json_response_class(Context()) is CustomJSONResponse
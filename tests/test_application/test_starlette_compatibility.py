@@ -1,5 +1,6 @@
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
 from ellar.app import AppFactory
 from ellar.common import (
     Inject,
@@ -117,6 +118,19 @@ class TestStarletteCompatibility:
         assert startup_complete
         assert cleanup_complete
 
+    def test_app_lifespan_configures_threadpool_tokens(self, test_client_factory):
+        @get("/")
+        async def homepage():
+            return anyio.to_thread.current_default_thread_limiter().total_tokens
+
+        app = Test.create_test_module(
+            routers=[homepage], config_module={"THREADPOOL_TOKENS": 5}
+        ).create_application()
+
+        with test_client_factory(app) as client:
+            response = client.get("/")
+            assert response.json() == 5
+
     def test_app_debug_return_html(self):
         @get("/")
         async def homepage(request: Inject[Request]):
@@ -29,3 +29,12 @@ def test_set_defaults_for_attribute_dict_type():
     assert instance.framework == instance["framework"]
     assert instance.extra == {"extra_key": 2}
     assert isinstance(instance.extra, MyDict)
+
+
+def test_attribute_dict_missing_key_and_methods():
+    instance = MyDict(name="Ellar", keys="shadowed")
+
+    assert instance.keys == "shadowed"
+    assert instance.set_defaults(framework="ASGI Framework") is None
+    assert instance.framework == "ASGI Framework"
+    assert instance.not_defined is None
@@ -199,6 +199,18 @@ BODY_UNAUTHORIZED_DEFAULT = {"detail": "Forbidden"}
             200,
             {"authentication": "bearertoken"},
         ),
+        (
+            "/bearer",
+            {"headers": {"Authorization": "BEARER bearertoken"}},
+            200,
+            {"authentication": "bearertoken"},
+        ),
+        (
+            "/bearer",
+            {"headers": {"Authorization": "bEaReR bearertoken"}},
+            200,
+            {"authentication": "bearertoken"},
+        ),
         (
             "/bearer",
             {"headers": {"Authorization": "Invalid bearertoken"}},
@@ -1,9 +1,9 @@
 import re
 
-from ellar.auth.session import SessionStrategy
+from ellar.auth.session import SessionCookieObject, SessionStrategy
 from ellar.auth.session.strategy import SessionClientStrategy
-from ellar.common import Controller, Inject, delete, get, post
-from ellar.core import Request
+from ellar.common import Controller, Inject, delete, get, post, put
+from ellar.core import Config, Request
 from ellar.core.router_builders import ControllerRouterBuilder
 from ellar.testing import Test
 from starlette.routing import Mount
@@ -21,6 +21,12 @@ class SessionSampleController:
         request.session.update(data)
         return {"session": request.session}
 
+    @put()
+    async def add_to_session_cart(self, request: Inject[Request]):
+        data = await request.json()
+        request.session["cart"].append(data["item"])
+        return {"session": request.session}
+
     @delete()
     async def clear_session(self, request: Inject[Request]):
         request.session.clear()
@@ -183,3 +189,89 @@ def test_session_cookie():
     client.cookies.delete("session")
     response = client.get("/")
     assert response.json() == {"session": {}}
+
+
+def test_session_cookie_is_read_among_other_cookies():
+    test_module = Test.create_test_module(
+        controllers=[SessionSampleController], config_module={"SECRET_KEY": "secret"}
+    )
+    test_module.override_provider(SessionStrategy, use_class=SessionClientStrategy)
+    client = test_module.get_test_client()
+
+    response = client.post("/", json={"some": "data"})
+    session_match = re.search(r"session=([^;]*);", response.headers["set-cookie"])
+    assert session_match is not None
+
+    client = test_module.get_test_client()
+    response = client.get(
+        "/",
+        headers={
+            "Cookie": f'theme=dark; session="{session_match[1]}"; sessionid=other'
+        },
+    )
+    assert response.json() == {"session": {"some": "data"}}
+
+    response = client.get("/", headers={"Cookie": "theme=dark; sessionid=other"})
+    assert response.json() == {"session": {}}
+
+
+def test_session_cookie_is_only_sent_when_needed():
+    test_module = Test.create_test_module(
+        controllers=[SessionSampleController],
+        config_module={"SECRET_KEY": "secret", "SESSION_COOKIE_MAX_AGE": None},
+    )
+    test_module.override_provider(SessionStrategy, use_class=SessionClientStrategy)
+    client = test_module.get_test_client()
+
+    # no session and no cookie to clear
+    response = client.get("/")
+    assert "set-cookie" not in response.headers
+
+    response = client.post("/", json={"some": "data"})
+    assert "set-cookie" in response.headers
+
+    # session unchanged and the cookie has no Max-Age to refresh
+    response = client.get("/")
+    assert response.json() == {"session": {"some": "data"}}
+    assert "set-cookie" not in response.headers
+
+    response = client.delete("/")
+    assert "session=null;" in response.headers["set-cookie"]
+
+
+def test_nested_session_changes_are_persisted_without_max_age():
+    test_module = Test.create_test_module(
+        controllers=[SessionSampleController],
+        config_module={"SECRET_KEY": "secret", "SESSION_COOKIE_MAX_AGE": None},
+    )
+    test_module.override_provider(SessionStrategy, use_class=SessionClientStrategy)
+    client = test_module.get_test_client()
+
+    response = client.post("/", json={"cart": [1]})
+    assert "set-cookie" in response.headers
+
+    # in-place change does not set the `modified` flag of the session
+    response = client.put("/", json={"item": 2})
+    assert "set-cookie" in response.headers
+
+    response = client.get("/")
+    assert response.json() == {"session": {"cart": [1, 2]}}
+
+
+def test_nested_session_changes_are_serialized():
+    strategy = SessionClientStrategy(Config(SECRET_KEY="secret"))
+
+    def get_cookie_value(header_value: str) -> str:
+        return header_value.split(";", 1)[0].split("=", 1)[1]
+
+    header_value = strategy.serialize_session(SessionCookieObject(cart=[1]))
+    session = strategy.deserialize_session(get_cookie_value(header_value))
+
+    # in-place change, `modified` stays False
+    session["cart"].append(2)
+    assert not session.modified
+
+    header_value = strategy.serialize_session(session)
+    assert strategy.deserialize_session(get_cookie_value(header_value)) == {
+        "cart": [1, 2]
+    }
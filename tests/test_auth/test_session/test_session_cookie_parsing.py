@@ -0,0 +1,34 @@
+import pytest
+from ellar.auth.middleware.session import _get_cookie
+from starlette.requests import cookie_parser
+
+
+def _scope(cookie: str) -> dict:
+    return {"headers": [(b"host", b"testserver"), (b"cookie", cookie.encode())]}
+
+
+@pytest.mark.parametrize(
+    "cookie",
+    [
+        "theme=dark; session=data; sessionid=other",
+        "session=first; session=last",
+        ' session = "quoted\\"value\\012" ;',
+        ";;==;session",
+        "=session; session=",
+        "session_data=1; session=a=b",
+        "theme=dark",
+    ],
+)
+def test_get_cookie_matches_starlette_cookie_parser(cookie):
+    assert _get_cookie(_scope(cookie), "session") == cookie_parser(cookie).get(
+        "session"
+    )
+
+
+def test_get_cookie_without_cookie_header():
+    assert _get_cookie({"headers": [(b"host", b"testserver")]}, "session") is None
+
+
+def test_get_cookie_handles_large_adversarial_header():
+    cookie = "a=b;" * 100000 + ";;==" * 10000 + '; session="' + "\\" * 100000 + '"'
+    assert _get_cookie(_scope(cookie), "session") == "\\" * 50000
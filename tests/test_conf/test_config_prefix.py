@@ -5,6 +5,7 @@ ELLAR_DEBUG = True
 ELLAR_SECRET_KEY = "your-secret-key-changed"
 ELLAR_INJECTOR_AUTO_BIND = True
 ELLAR_JINJA_TEMPLATES_OPTIONS = {"auto_reload": True}
+ELLAR_CUSTOM_ELLAR_VALUE = "prefix is only stripped from the start"
 
 
 def test_config_with_prefix():
@@ -16,6 +17,7 @@ def test_config_with_prefix():
     assert config.SECRET_KEY == "your-secret-key-changed"
     assert config.INJECTOR_AUTO_BIND
     assert config.JINJA_TEMPLATES_OPTIONS["auto_reload"]
+    assert config.CUSTOM_ELLAR_VALUE == "prefix is only stripped from the start"
 
 
 def test_for_app_factory():
@@ -166,3 +166,62 @@ def test_can_export_configuration_values():
     values = list(config.config_values)
 
     assert len(values) > 7
+
+
+def test_configuration_instances_from_same_module_do_not_share_values():
+    config_a = Config(config_module=overriding_settings_path)
+    config_b = Config(config_module=overriding_settings_path)
+
+    config_a.DEBUG = False
+    config_a.SOME_NEW_CONFIGS = "some new configuration values"
+
+    assert config_b.DEBUG is True
+    assert "SOME_NEW_CONFIGS" not in config_b
+
+
+def test_configuration_instances_do_not_share_container_values():
+    config_a = Config(config_module=overriding_settings_path)
+    config_b = Config(config_module=overriding_settings_path)
+
+    # in-place change on the stored settings of one instance
+    config_a._schema.JINJA_TEMPLATES_OPTIONS["extensions"] = ["jinja2.ext.i18n"]
+    config_a._schema.MIDDLEWARE.clear()
+
+    assert "extensions" not in config_b.JINJA_TEMPLATES_OPTIONS
+    assert len(config_b.MIDDLEWARE) > 0
+
+
+def test_configuration_reflects_changes_to_config_source():
+    assert Config(config_module=overriding_settings_path).DEBUG is True
+
+    ConfigTesting.DEBUG = False
+    try:
+        assert Config(config_module=overriding_settings_path).DEBUG is False
+    finally:
+        ConfigTesting.DEBUG = True
+
+
+def test_configuration_reads_reflect_later_changes():
+    config = Config(config_module=overriding_settings_path)
+    assert config.DEBUG is True
+    assert config.THREADPOOL_TOKENS is None
+
+    config.DEBUG = False
+    config.set_defaults(THREADPOOL_TOKENS=10)
+    assert config.DEBUG is False
+    assert config.THREADPOOL_TOKENS == 10
+
+    config.SOME_NEW_CONFIGS = "some new configuration values"
+    assert config.SOME_NEW_CONFIGS == "some new configuration values"
+    del config.SOME_NEW_CONFIGS
+    assert "SOME_NEW_CONFIGS" not in config
+    with pytest.raises(AttributeError):
+        assert config.SOME_NEW_CONFIGS
+
+
+@pytest.mark.parametrize("threadpool_tokens", [0, -1])
+def test_threadpool_tokens_must_be_positive(threadpool_tokens):
+    with pytest.raises(
+        ValueError, match="THREADPOOL_TOKENS must be a positive integer"
+    ):
+        Config(THREADPOOL_TOKENS=threadpool_tokens)
@@ -50,3 +50,28 @@ async def test_injectable_class_uses_defined_scope_during_runtime():
     ):
         # request scope outside request
         assert injector.get(SampleInjectableB) == injector.get(SampleInjectableB)
+
+
+def test_injectable_subclass_resolves_inherited_and_own_init_dependencies():
+    @injectable(scope=transient_scope)
+    class BaseService:
+        def __init__(self, a: SampleInjectableA) -> None:
+            self.a = a
+
+    @injectable(scope=transient_scope)
+    class InheritedInitService(BaseService):
+        pass
+
+    @injectable(scope=transient_scope)
+    class OwnInitService(BaseService):
+        def __init__(self, a: SampleInjectableA, c: SampleInjectableC) -> None:
+            super().__init__(a)
+            self.c = c
+
+    injector = EllarInjector(auto_bind=True)
+
+    assert isinstance(injector.get(InheritedInitService).a, SampleInjectableA)
+
+    service = injector.get(OwnInitService)
+    assert isinstance(service.a, SampleInjectableA)
+    assert isinstance(service.c, SampleInjectableC)
@@ -6,6 +6,7 @@ from ellar.di import (
     injectable,
     is_decorated_with_injectable,
 )
+from ellar.di.constants import INJECTABLE_ATTRIBUTE
 from ellar.di.providers import ClassProvider, ModuleProvider
 from ellar.di.scopes import SingletonScope, TransientScope
 from ellar.utils.importer import get_class_import
@@ -56,6 +57,19 @@ def test_injectable_and_scopes():
     assert get_scope(InjectType2) is TransientScope
 
 
+def test_get_scope_uses_dunder_scope_only_without_injectable_scope():
+    class DunderScopeType:
+        __scope__ = SingletonScope
+
+    class NoneScopeType:
+        __scope__ = SingletonScope
+
+    setattr(NoneScopeType, INJECTABLE_ATTRIBUTE, None)
+
+    assert get_scope(DunderScopeType) is SingletonScope
+    assert get_scope(NoneScopeType) is None
+
+
 def test_provider_config_registers_correctly():
     injector = EllarInjector(auto_bind=False)
     providers = [
@@ -69,6 +69,7 @@ def test_add_module_fails_when_parent_module_does_not_exist():
         tree_manager.add_module(
             module_type, ModuleSetup(module_type), parent_module=parent_module_type
         )
+    assert tree_manager.get_module(module_type) is None
 
 
 def test_add_module_dependency_fails_when_parent_does_not_exist():
@@ -130,6 +131,16 @@ def test_get_module_by_ref_type_works():
     assert len(items) == 1
     assert items[0].value == app_dependent_module
 
+    # index is refreshed when modules change
+    plain_module = ModuleSetup(Module()(get_unique_type("AppModuleType")))
+    tree_manager.update_module(app_dependent_module.module, plain_module)
+    assert tree_manager.get_by_ref_type(MODULE_REF_TYPES.APP_DEPENDENT) == []
+    items = tree_manager.get_by_ref_type(MODULE_REF_TYPES.DYNAMIC)
+    assert [item.value for item in items] == [
+        tree_manager.get_module(module_type).value,
+        plain_module,
+    ]
+
 
 def test_get_module_dependencies_return_empty_if_module_type_does_not_exist():
     tree_manager = ModuleTreeManager()
@@ -173,6 +184,35 @@ def test_search_module_tree_works():
     assert res.value.module == module_type_
 
 
+def test_search_module_tree_handles_deep_module_chains():
+    core_module_type = ModuleSetup(Module()(get_unique_type("CoreModuleType")))
+    tree_manager = ModuleTreeManager(core_module_type)
+
+    app_module_type = Module()(get_unique_type("AppModuleType"))
+    tree_manager.add_module(app_module_type, ModuleSetup(app_module_type))
+
+    parent = app_module_type
+    for _ in range(2000):
+        module_type = Module()(get_unique_type("ModuleType"))
+        tree_manager.add_module(module_type, ModuleSetup(module_type), parent)
+        parent = module_type
+
+    res = tree_manager.search_module_tree(
+        lambda data: data.value.module == app_module_type,
+        lambda data: data.value.module == parent,
+    )
+    assert res is not None
+    assert res.value.module == parent
+
+    assert (
+        tree_manager.search_module_tree(
+            lambda data: data.value.module == app_module_type,
+            lambda data: False,
+        )
+        is None
+    )
+
+
 def test_find_module_return_list_of_items():
     core_module_type = ModuleSetup(Module()(get_unique_type("CoreModuleType")))
     tree_manager = ModuleTreeManager(core_module_type)
@@ -194,3 +234,19 @@ def test_find_module_return_list_of_items():
     assert len(res) == 10
     for item in res:
         assert item.parent == app_module_type
+
+
+def test_add_or_update_registers_module_with_unregistered_parent():
+    tree_manager = ModuleTreeManager()
+
+    module_type = Module()(get_unique_type("ModuleType"))
+    parent_module_type = Module()(get_unique_type("ModuleType"))
+
+    tree_manager.add_or_update(
+        module_type, ModuleSetup(module_type), parent_module=parent_module_type
+    )
+
+    data = tree_manager.get_module(module_type)
+    assert data is not None
+    assert data.parent is parent_module_type
+    assert tree_manager.get_module(parent_module_type) is None
@@ -11,10 +11,12 @@ from ellar.core.security.hashers import (
     PBKDF2SHA1Hasher,
     ScryptHasher,
     check_password,
+    check_password_async,
     get_hasher,
     identify_hasher,
     is_password_usable,
     make_password,
+    make_password_async,
 )
 
 
@@ -196,6 +198,19 @@ class TestUtilsHashPass:
         with pytest.raises(ValueError, match="Unable to identify Hasher"):
             identify_hasher("lolcat$salt$hash")
 
+    @pytest.mark.asyncio
+    async def test_async_password_helpers(self):
+        encoded = await make_password_async("lètmein", "pbkdf2_sha1")
+        assert identify_hasher(encoded).algorithm == "pbkdf2_sha1"
+
+        updated = []
+        assert await check_password_async("lètmein", encoded, updated.append) is True
+        assert updated == ["lètmein"]
+
+        updated.clear()
+        assert await check_password_async("lètmeinz", encoded, updated.append) is False
+        assert updated == []
+
     @pytest.mark.parametrize("password", ("lètmein_badencoded", "", None))
     def test_is_password_usable(self, password):
         assert is_password_usable(password) is True
@@ -84,3 +84,21 @@ def test_api_info_extra_keys():
             "tags": ["default"],
         }
     }
+
+
+def test_api_info_shared_metadata_is_not_mutated_across_endpoints():
+    @api_info(summary="Shared Summary", tags=["shared"])
+    def endpoint_a(request: Request):
+        pass  # pragma: no cover
+
+    @api_info(description="Extra Description")
+    @api_info(summary="Shared Summary", tags=["shared"])
+    def endpoint_b(request: Request):
+        pass  # pragma: no cover
+
+    open_api_data_a = reflect.get_metadata(OPENAPI_OPERATION_KEY, endpoint_a)
+    open_api_data_b = reflect.get_metadata(OPENAPI_OPERATION_KEY, endpoint_b)
+
+    assert open_api_data_a.description is None
+    assert open_api_data_a.summary == "Shared Summary"
+    assert open_api_data_b.description == "Extra Description"
@@ -74,6 +74,12 @@ def list_and_create_car(car: CreateCarSchema = Body(default=None)):
     return car
 
 
+@router.http_route("/update", response={200: CreateCarSchema}, methods=["put", "patch"])
+@reflect.metadata(IGNORE_CONTROLLER_TYPE, True)
+def update_car(car: CreateCarSchema, car_id: int = Query()):
+    return car
+
+
 ModuleRouterBuilder.build(router)
 
 
@@ -534,3 +540,65 @@ def test_open_api_route__get_openapi_path_object_works_for_routes_with_multiple_
             "name": "custom-key",
         }
     }
+
+
+def test_open_api_route_validation_error_responses_are_not_shared():
+    route_operation = reflect.get_metadata(
+        CONTROLLER_OPERATION_HANDLER_KEY, list_and_create_car
+    )
+    openapi_route_doc = OpenAPIRouteDocumentation(route=route_operation)
+    field_mapping, _ = get_definitions(
+        fields=openapi_route_doc.get_route_models(),
+        schema_generator=GenerateJsonSchema(),
+    )
+
+    path, _ = openapi_route_doc.get_child_openapi_path(field_mapping=field_mapping)
+    path["get"]["responses"]["422"]["description"] = "Changed"
+
+    assert path["post"]["responses"]["422"]["description"] == "Validation Error"
+
+    path, _ = openapi_route_doc.get_child_openapi_path(field_mapping=field_mapping)
+    assert path["get"]["responses"]["422"]["description"] == "Validation Error"
+
+
+def test_open_api_route_parameters_and_request_body_are_not_shared():
+    route_operation = reflect.get_metadata(CONTROLLER_OPERATION_HANDLER_KEY, update_car)
+    openapi_route_doc = OpenAPIRouteDocumentation(route=route_operation)
+    field_mapping, _ = get_definitions(
+        fields=openapi_route_doc.get_route_models(),
+        schema_generator=GenerateJsonSchema(),
+    )
+
+    path, _ = openapi_route_doc.get_child_openapi_path(field_mapping=field_mapping)
+    path["put"]["parameters"][0]["description"] = "Changed"
+    path["put"]["requestBody"]["required"] = False
+
+    assert "description" not in path["patch"]["parameters"][0]
+    assert path["patch"]["requestBody"]["required"] is True
+
+
+def test_open_api_route_parameter_templates_are_not_shared():
+    route_operation = reflect.get_metadata(
+        CONTROLLER_OPERATION_HANDLER_KEY, get_car_by_id
+    )
+    openapi_route_doc = OpenAPIRouteDocumentation(route=route_operation)
+    field_mapping, _ = get_definitions(
+        fields=openapi_route_doc.get_route_models(),
+        schema_generator=GenerateJsonSchema(),
+    )
+
+    result = openapi_route_doc.get_openapi_operation_parameters(
+        field_mapping=field_mapping
+    )
+    for parameter in result:
+        parameter["description"] = "Changed"
+
+    result = openapi_route_doc.get_openapi_operation_parameters(
+        field_mapping=field_mapping
+    )
+    assert [parameter.get("description") for parameter in result] == [
+        None,
+        None,
+        None,
+        "input field description",
+    ]
@@ -91,6 +91,21 @@ def test_define_metadata_with_existing_set(random_type):
     assert reflect.get_metadata("A", random_type) == {"AnotherEllar", "EllarA"}
 
 
+def test_define_metadata_with_existing_set_keeps_set_type(random_type):
+    class TagSet(set):
+        pass
+
+    reflect.add_type_update_callback(TagSet, reflect._data_type_update_callbacks[set])
+    try:
+        reflect.define_metadata("A", TagSet({"EllarA"}), random_type)
+        reflect.define_metadata("A", {"AnotherEllar"}, random_type)
+        value = reflect.get_metadata("A", random_type)
+        assert type(value) is TagSet
+        assert value == {"AnotherEllar", "EllarA"}
+    finally:
+        reflect._data_type_update_callbacks.pop(TagSet)
+
+
 def test_reflect_meta_decorator():
     @reflect.metadata("defined_key", "chioma")
     @reflect.metadata("defined_key_b", "jessy")